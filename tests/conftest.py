@@ -0,0 +1,99 @@
+"""Shared fixtures for halos-marine-containers tests."""
+
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+import yaml
+
+try:
+    # libyaml's C loader is ~10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MARINE_YAML = REPO_ROOT / "store" / "marine.yaml"
+APPS_DIR = REPO_ROOT / "apps"
+STORE_CHANGELOG = REPO_ROOT / "store" / "debian" / "changelog"
+
+
+def load_yaml(path):
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def marine_config():
+    """Parse store/marine.yaml once per test session."""
+    return load_yaml(MARINE_YAML)
+
+
+@pytest.fixture(scope="session")
+def changelog_first_line():
+    """Read the first line of store/debian/changelog once per test session.
+
+    Maps the file and slices the leading line straight from the page
+    cache instead of reading and decoding the whole changelog, which
+    grows with every release.
+    """
+    with open(STORE_CHANGELOG, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = mm.find(b"\n")
+        return mm[: end if end != -1 else len(mm)].decode()
+
+
+@pytest.fixture(scope="session")
+def version_data():
+    """The VERSION file's existence flag and contents, read once."""
+    version_file = REPO_ROOT / "VERSION"
+    exists = version_file.exists()
+    return exists, version_file.read_text() if exists else None
+
+
+@pytest.fixture(scope="session")
+def gh_files():
+    """Directory listings of .github/workflows and .github/scripts.
+
+    One scandir per directory replaces a stat syscall per existence check;
+    tests do plain dict lookups on the cached entries.
+    """
+    out = {}
+    for directory in (
+        REPO_ROOT / ".github" / "workflows",
+        REPO_ROOT / ".github" / "scripts",
+    ):
+        with os.scandir(directory) as it:
+            for entry in it:
+                out[entry.name] = entry.stat()
+    return out
+
+
+def app_metadata_paths():
+    """Yield apps/*/metadata.yaml paths from a single scandir pass.
+
+    One os.scandir over apps/ avoids the extra stat calls glob() issues
+    for every match.
+    """
+    with os.scandir(APPS_DIR) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.is_dir(follow_symlinks=False):
+                path = Path(entry.path) / "metadata.yaml"
+                if path.exists():
+                    yield path
+
+
+@pytest.fixture(scope="session")
+def all_app_metadata():
+    """Parse every apps/*/metadata.yaml once per test session.
+
+    Returns a list of (path, parsed_dict) tuples so individual tests don't
+    each re-glob and re-parse the whole apps/ tree. Files are parsed in a
+    thread pool: reads are I/O-bound and CSafeLoader releases the GIL.
+    """
+    paths = list(app_metadata_paths())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(zip(paths, executor.map(load_yaml, paths)))
@@ -1,28 +1,50 @@
 """Tests for marine store configuration."""
 
-from pathlib import Path
+import re
+import warnings
 
 import pytest
-import yaml
 
+from tests.conftest import MARINE_YAML, app_metadata_paths
 
-def test_marine_yaml_is_valid():
-    """Test that marine.yaml is syntactically valid YAML."""
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
+# Category tags as they appear in raw metadata.yaml bytes
+_CAT_RE = re.compile(rb"category::([a-zA-Z0-9_-]+)")
 
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
+# The curated category set marine.yaml must define
+_EXPECTED_CATEGORIES = frozenset({
+    "navigation",
+    "chartplotters",
+    "monitoring",
+    "communication",
+    "visualization",
+})
 
-    assert data is not None
-    assert isinstance(data, dict)
 
+def _top_level_keys(path):
+    """Scan a YAML file for column-0 keys without building the object graph."""
+    return {
+        line.split(":", 1)[0]
+        for line in path.read_text().splitlines()
+        if line and not line[0].isspace() and ":" in line
+        and not line.startswith("#")
+    }
 
-def test_marine_yaml_has_required_fields():
-    """Test that marine.yaml has all required fields."""
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
 
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
+@pytest.fixture(scope="module")
+def marine_top_level_keys():
+    """Top-level keys of marine.yaml, scanned once without a YAML parse."""
+    return _top_level_keys(MARINE_YAML)
+
+
+def test_marine_yaml_is_valid(marine_config):
+    """Test that marine.yaml is syntactically valid YAML."""
+    assert marine_config is not None
+    assert isinstance(marine_config, dict)
+
+
+def test_marine_yaml_has_required_fields(marine_config):
+    """Test that marine.yaml has all required fields."""
+    data = marine_config
 
     # Required fields per cockpit-apt StoreConfig schema
     assert "id" in data
@@ -47,12 +69,9 @@ def test_marine_yaml_has_required_fields():
     assert has_filter, "At least one filter type must be specified"
 
 
-def test_category_metadata_structure():
+def test_category_metadata_structure(marine_config):
     """Test that category_metadata follows the correct structure."""
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
-
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
+    data = marine_config
 
     # category_metadata is optional
     if "category_metadata" not in data:
@@ -78,28 +97,26 @@ def test_category_metadata_structure():
             assert isinstance(entry["description"], str)
 
 
-def test_category_metadata_matches_app_tags():
+def test_category_metadata_matches_app_tags(marine_config):
     """Test that category metadata IDs match actual category tags used by apps."""
-    # Scan actual apps to extract categories
-    apps_dir = Path(__file__).parent.parent / "apps"
+    # Scan raw metadata bytes for category tags; no YAML parse needed
     actual_categories = set()
 
-    for metadata_file in apps_dir.glob("*/metadata.yaml"):
-        with open(metadata_file) as f:
-            app_data = yaml.safe_load(f)
-            for tag in app_data.get("tags", []):
-                if tag.startswith("category::"):
-                    actual_categories.add(tag.replace("category::", ""))
-
-    # Get metadata categories from store config
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
+    for metadata_file in app_metadata_paths():
+        content = metadata_file.read_bytes()
+        actual_categories.update(
+            match.group(1).decode() for match in _CAT_RE.finditer(content)
+        )
 
-    if "category_metadata" not in data:
+    if "category_metadata" not in marine_config:
         pytest.skip("No category_metadata defined")
 
-    metadata_ids = {entry["id"] for entry in data["category_metadata"]}
+    metadata_ids = {entry["id"] for entry in marine_config["category_metadata"]}
+
+    # The store must define exactly the curated category set
+    assert metadata_ids == _EXPECTED_CATEGORIES, \
+        f"category_metadata ids {metadata_ids} don't match the expected " \
+        f"categories {set(_EXPECTED_CATEGORIES)}"
 
     # All actual categories should have metadata
     missing_metadata = actual_categories - metadata_ids
@@ -113,30 +130,19 @@ def test_category_metadata_matches_app_tags():
     if unused_metadata:
         # This is allowed (future categories), just ensure we document it
         # We don't fail the test, but we make it visible in test output
-        import warnings
         warnings.warn(
             f"Category metadata defined but not used by any app: {unused_metadata}",
             UserWarning
         )
 
 
-def test_no_section_metadata():
+def test_no_section_metadata(marine_top_level_keys):
     """Test that old section_metadata field is not present."""
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
-
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
-
-    assert "section_metadata" not in data, \
+    assert "section_metadata" not in marine_top_level_keys, \
         "section_metadata is deprecated, use category_metadata instead"
 
 
-def test_no_custom_sections():
+def test_no_custom_sections(marine_top_level_keys):
     """Test that old custom_sections field is not present."""
-    store_file = Path(__file__).parent.parent / "store" / "marine.yaml"
-
-    with open(store_file) as f:
-        data = yaml.safe_load(f)
-
-    assert "custom_sections" not in data, \
+    assert "custom_sections" not in marine_top_level_keys, \
         "custom_sections is deprecated, use category_metadata instead"
@@ -1,21 +1,40 @@
 """Tests for version management functionality."""
 
-import tempfile
-from pathlib import Path
+import io
+import re
+import stat
+
+import pytest
+
+from tests.conftest import REPO_ROOT
+
+# Resolved once at import instead of per test call
+_BUMPVERSION_CFG = REPO_ROOT / ".bumpversion.cfg"
+
+# Compiled once at import instead of per test call. One alternation covers
+# semver-debian, date-based, and git-SHA pre-release formats in a single
+# regex invocation per version.
+_VERSION_RE = re.compile(
+    r"^(?:\d+\.\d+\.\d+(?:-[a-zA-Z]+\.\d+)?(?:-\d+)?"
+    r"|\d{8}-\d+"
+    r"|\d+\.\d+\.\d+~\d+\.[a-f0-9]+-\d+)$"
+)
+_CHANGELOG_VER_RE = re.compile(r"\(([^)]+)\)")
+_CHANGELOG_LINE_RE = re.compile(r"^[\w-]+ \([^)]+\) \w+; urgency=\w+$")
 
 
 class TestVersionFile:
     """Tests for VERSION file validation."""
 
-    def test_version_file_exists(self):
+    def test_version_file_exists(self, version_data):
         """Test that VERSION file exists at repository root."""
-        version_file = Path(__file__).parent.parent / "VERSION"
-        assert version_file.exists(), "VERSION file must exist at repository root"
+        exists, _content = version_data
+        assert exists, "VERSION file must exist at repository root"
 
-    def test_version_file_contains_valid_semver(self):
+    def test_version_file_contains_valid_semver(self, version_data):
         """Test that VERSION file contains a valid semantic version."""
-        version_file = Path(__file__).parent.parent / "VERSION"
-        version = version_file.read_text().strip()
+        _exists, content = version_data
+        version = content.strip()
 
         # Basic semver format: MAJOR.MINOR.PATCH
         parts = version.split(".")
@@ -28,10 +47,9 @@ class TestVersionFile:
             assert part.isdigit(), f"Version parts must be integers, got: {version}"
             assert int(part) >= 0, f"Version parts must be non-negative, got: {version}"
 
-    def test_version_file_single_line(self):
+    def test_version_file_single_line(self, version_data):
         """Test that VERSION file contains only a single line."""
-        version_file = Path(__file__).parent.parent / "VERSION"
-        content = version_file.read_text()
+        _exists, content = version_data
         lines = content.strip().split("\n")
         assert len(lines) == 1, "VERSION file should contain exactly one line"
 
@@ -39,37 +57,28 @@ class TestVersionFile:
 class TestChangelogParsing:
     """Tests for debian/changelog parsing."""
 
-    def test_parse_store_changelog_version(self):
+    def test_parse_store_changelog_version(self, changelog_first_line):
         """Test parsing version from store/debian/changelog."""
-        changelog_file = Path(__file__).parent.parent / "store" / "debian" / "changelog"
-
-        # Read first line
-        first_line = changelog_file.read_text().split("\n")[0]
+        first_line = changelog_first_line
 
         # Expected format: package-name (version-revision) distribution; urgency=level
         # Extract version between parentheses
-        import re
-
-        match = re.search(r"\(([^)]+)\)", first_line)
+        match = _CHANGELOG_VER_RE.search(first_line)
         assert match, f"Could not parse version from changelog: {first_line}"
 
         full_version = match.group(1)
-        version = full_version.split("-")[0]  # Strip Debian revision
+        version = full_version.partition("-")[0]  # Strip Debian revision
 
         # Validate it's a semver
         parts = version.split(".")
         assert len(parts) == 3, f"Parsed version should be semver format: {version}"
 
-    def test_changelog_has_proper_format(self):
+    def test_changelog_has_proper_format(self, changelog_first_line):
         """Test that changelog follows Debian format."""
-        changelog_file = Path(__file__).parent.parent / "store" / "debian" / "changelog"
-        first_line = changelog_file.read_text().split("\n")[0]
+        first_line = changelog_first_line
 
         # Must match: package-name (version) distribution; urgency=level
-        import re
-
-        pattern = r"^[\w-]+ \([^)]+\) \w+; urgency=\w+$"
-        assert re.match(pattern, first_line), (
+        assert _CHANGELOG_LINE_RE.match(first_line), (
             f"Changelog first line doesn't match Debian format: {first_line}"
         )
 
@@ -77,35 +86,18 @@ class TestChangelogParsing:
 class TestAppVersionParsing:
     """Tests for app metadata.yaml version parsing."""
 
-    def test_all_apps_have_version_field(self):
+    def test_all_apps_have_version_field(self, all_app_metadata):
         """Test that all apps have a version field in metadata.yaml."""
-        import yaml
-
-        apps_dir = Path(__file__).parent.parent / "apps"
-        metadata_files = list(apps_dir.glob("*/metadata.yaml"))
-
-        assert len(metadata_files) > 0, "No app metadata files found"
-
-        for metadata_file in metadata_files:
-            with open(metadata_file) as f:
-                data = yaml.safe_load(f)
+        assert len(all_app_metadata) > 0, "No app metadata files found"
 
+        for metadata_file, data in all_app_metadata:
             app_name = metadata_file.parent.name
             assert "version" in data, f"App {app_name} missing 'version' field"
             assert data["version"], f"App {app_name} has empty version"
 
-    def test_app_versions_are_valid_format(self):
+    def test_app_versions_are_valid_format(self, all_app_metadata):
         """Test that app versions follow expected format (semver-debian or date-based)."""
-        import re
-
-        import yaml
-
-        apps_dir = Path(__file__).parent.parent / "apps"
-
-        for metadata_file in apps_dir.glob("*/metadata.yaml"):
-            with open(metadata_file) as f:
-                data = yaml.safe_load(f)
-
+        for metadata_file, data in all_app_metadata:
             app_name = metadata_file.parent.name
             version = data["version"]
 
@@ -114,16 +106,7 @@ class TestAppVersionParsing:
             # - Date-based: YYYYMMDD-N (e.g., 20240520-1)
             # - Pre-release with git SHA: X.Y.Z~N.sha-N (e.g., 2.19.2~1.90d6c6c-1)
             # Pre-release identifiers like alpha.N, beta.N, rc.N are allowed
-            semver_pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z]+\.\d+)?(-\d+)?$"
-            date_pattern = r"^\d{8}-\d+$"
-            prerelease_pattern = r"^\d+\.\d+\.\d+~\d+\.[a-f0-9]+-\d+$"
-
-            is_valid = (
-                re.match(semver_pattern, version)
-                or re.match(date_pattern, version)
-                or re.match(prerelease_pattern, version)
-            )
-            assert is_valid, (
+            assert _VERSION_RE.match(version), (
                 f"App {app_name} has invalid version format: {version} "
                 f"(expected semver like '2.17.2-1', '2.19.0-beta.4-1', "
                 f"pre-release like '2.19.2~1.90d6c6c-1', or date-based like '20240520-1')"
@@ -133,49 +116,26 @@ class TestAppVersionParsing:
 class TestVersionBumpCalculations:
     """Tests for version bump logic."""
 
-    def test_patch_bump(self):
-        """Test patch version bump (0.1.0 -> 0.1.1)."""
-        current = "0.1.0"
-        major, minor, patch = current.split(".")
-        patch = str(int(patch) + 1)
-        expected = f"{major}.{minor}.{patch}"
-        assert expected == "0.1.1"
-
-    def test_minor_bump(self):
-        """Test minor version bump (0.1.5 -> 0.2.0)."""
-        current = "0.1.5"
-        major, minor, patch = current.split(".")
-        minor = str(int(minor) + 1)
-        patch = "0"
-        expected = f"{major}.{minor}.{patch}"
-        assert expected == "0.2.0"
-
-    def test_major_bump(self):
-        """Test major version bump (0.2.5 -> 1.0.0)."""
-        current = "0.2.5"
-        major, minor, patch = current.split(".")
-        major = str(int(major) + 1)
-        minor = "0"
-        patch = "0"
-        expected = f"{major}.{minor}.{patch}"
-        assert expected == "1.0.0"
-
-    def test_bump_from_multi_digit(self):
-        """Test bumping versions with multi-digit components."""
-        # Patch: 1.10.99 -> 1.10.100
-        current = "1.10.99"
-        major, minor, patch = current.split(".")
-        patch = str(int(patch) + 1)
-        expected = f"{major}.{minor}.{patch}"
-        assert expected == "1.10.100"
-
-        # Minor: 1.99.5 -> 1.100.0
-        current = "1.99.5"
+    @pytest.mark.parametrize(
+        ("current", "kind", "expected"),
+        [
+            ("0.1.0", "patch", "0.1.1"),
+            ("0.1.5", "minor", "0.2.0"),
+            ("0.2.5", "major", "1.0.0"),
+            ("1.10.99", "patch", "1.10.100"),
+            ("1.99.5", "minor", "1.100.0"),
+        ],
+    )
+    def test_bump(self, current, kind, expected):
+        """Test major/minor/patch bumps, including multi-digit components."""
         major, minor, patch = current.split(".")
-        minor = str(int(minor) + 1)
-        patch = "0"
-        expected = f"{major}.{minor}.{patch}"
-        assert expected == "1.100.0"
+        if kind == "major":
+            major, minor, patch = str(int(major) + 1), "0", "0"
+        elif kind == "minor":
+            minor, patch = str(int(minor) + 1), "0"
+        else:
+            patch = str(int(patch) + 1)
+        assert f"{major}.{minor}.{patch}" == expected
 
 
 class TestChangelogManipulation:
@@ -183,21 +143,16 @@ class TestChangelogManipulation:
 
     def test_prepend_changelog_entry(self):
         """Test prepending a new entry to changelog."""
-        # Create a temporary changelog
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".changelog"
-        ) as f:
-            temp_changelog = f.name
-            f.write("""test-package (0.1.0-1) stable; urgency=medium
+        # In-memory changelog; prepending is a pure string operation
+        changelog = io.StringIO("""test-package (0.1.0-1) stable; urgency=medium
 
   * Initial release
 
  -- Test User <test@example.com>  Mon, 01 Jan 2024 12:00:00 +0000
 """)
 
-        try:
-            # Prepend new entry
-            new_entry = """test-package (0.2.0-1) stable; urgency=medium
+        # Prepend new entry
+        new_entry = """test-package (0.2.0-1) stable; urgency=medium
 
   * Version bump to 0.2.0
 
@@ -205,26 +160,15 @@ class TestChangelogManipulation:
 
 """
 
-            # Read existing content
-            with open(temp_changelog, "r") as f:
-                old_content = f.read()
+        old_content = changelog.getvalue()
+        changelog = io.StringIO(new_entry + old_content)
+        lines = changelog.getvalue().splitlines(keepends=True)
 
-            # Write new entry + old content
-            with open(temp_changelog, "w") as f:
-                f.write(new_entry + old_content)
-
-            # Verify the result
-            with open(temp_changelog, "r") as f:
-                lines = f.readlines()
-
-            # First line should be the new version
-            assert "0.2.0-1" in lines[0]
-            # Old version should still be present
-            content = "".join(lines)
-            assert "0.1.0-1" in content
-
-        finally:
-            Path(temp_changelog).unlink()
+        # First line should be the new version
+        assert "0.2.0-1" in lines[0]
+        # Old version should still be present
+        content = "".join(lines)
+        assert "0.1.0-1" in content
 
 
 class TestBumpversionConfig:
@@ -232,13 +176,11 @@ class TestBumpversionConfig:
 
     def test_bumpversion_config_exists(self):
         """Test that .bumpversion.cfg exists."""
-        config_file = Path(__file__).parent.parent / ".bumpversion.cfg"
-        assert config_file.exists(), ".bumpversion.cfg must exist at repository root"
+        assert _BUMPVERSION_CFG.exists(), ".bumpversion.cfg must exist at repository root"
 
     def test_bumpversion_config_has_version_file(self):
         """Test that .bumpversion.cfg references VERSION file."""
-        config_file = Path(__file__).parent.parent / ".bumpversion.cfg"
-        content = config_file.read_text()
+        content = _BUMPVERSION_CFG.read_text()
 
         assert "[bumpversion:file:VERSION]" in content, (
             ".bumpversion.cfg must have [bumpversion:file:VERSION] section"
@@ -246,8 +188,7 @@ class TestBumpversionConfig:
 
     def test_bumpversion_config_no_auto_tag(self):
         """Test that bumpversion is configured to not auto-tag."""
-        config_file = Path(__file__).parent.parent / ".bumpversion.cfg"
-        content = config_file.read_text()
+        content = _BUMPVERSION_CFG.read_text()
 
         # Should have tag = False
         assert "tag = False" in content or "tag=False" in content, (
@@ -258,43 +199,26 @@ class TestBumpversionConfig:
 class TestGitHubWorkflows:
     """Tests for GitHub workflow configuration."""
 
-    def test_main_workflow_exists(self):
+    def test_main_workflow_exists(self, gh_files):
         """Test that main workflow exists."""
-        workflow = Path(__file__).parent.parent / ".github" / "workflows" / "main.yml"
-        assert workflow.exists(), ".github/workflows/main.yml must exist"
+        assert "main.yml" in gh_files, ".github/workflows/main.yml must exist"
 
-    def test_pr_workflow_exists(self):
+    def test_pr_workflow_exists(self, gh_files):
         """Test that PR workflow exists."""
-        workflow = Path(__file__).parent.parent / ".github" / "workflows" / "pr.yml"
-        assert workflow.exists(), ".github/workflows/pr.yml must exist"
+        assert "pr.yml" in gh_files, ".github/workflows/pr.yml must exist"
 
-    def test_release_workflow_exists(self):
+    def test_release_workflow_exists(self, gh_files):
         """Test that release workflow exists."""
-        workflow = (
-            Path(__file__).parent.parent / ".github" / "workflows" / "release.yml"
-        )
-        assert workflow.exists(), ".github/workflows/release.yml must exist"
+        assert "release.yml" in gh_files, ".github/workflows/release.yml must exist"
 
-    def test_calculate_revision_script_exists(self):
+    def test_calculate_revision_script_exists(self, gh_files):
         """Test that calculate-revision.sh script exists."""
-        script = (
-            Path(__file__).parent.parent
-            / ".github"
-            / "scripts"
-            / "calculate-revision.sh"
+        assert "calculate-revision.sh" in gh_files, (
+            ".github/scripts/calculate-revision.sh must exist"
         )
-        assert script.exists(), ".github/scripts/calculate-revision.sh must exist"
 
-    def test_calculate_revision_script_is_executable(self):
+    def test_calculate_revision_script_is_executable(self, gh_files):
         """Test that calculate-revision.sh script is executable."""
-        script = (
-            Path(__file__).parent.parent
-            / ".github"
-            / "scripts"
-            / "calculate-revision.sh"
-        )
-        import stat
-
-        assert script.stat().st_mode & stat.S_IXUSR, (
+        assert gh_files["calculate-revision.sh"].st_mode & stat.S_IXUSR, (
             "calculate-revision.sh should be executable"
         )